@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 @dataclass
 class ScraperConfig:
@@ -17,6 +17,17 @@ class ScraperConfig:
     timeout: int = 30
     min_text_length: int = 50
     max_text_length: int = 100000
+    max_download_bytes: int = 5_000_000
+    chunk_size: int = 16384
+    allowed_content_types: Tuple[str, ...] = ('text/html', 'application/xhtml+xml')
     parallel_requests: int = 3
     language: str = "en"
-    follow_robots_txt: bool = True
\ No newline at end of file
+    follow_robots_txt: bool = True
+    page_budget: Optional[int] = None
+    relevant_page_target: Optional[int] = None
+    relevance_threshold: float = 0.5
+    queue_path: str = str(Path("data/queue.sqlite"))
+    worker_id: Optional[str] = None
+    lease_timeout: float = 300.0
+    heartbeat_interval: float = 30.0
+    claim_batch_size: int = 10
\ No newline at end of file
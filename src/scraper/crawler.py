@@ -1,10 +1,14 @@
+import heapq
+import itertools
 import logging
-from typing import List, Set, Optional
+from typing import List, Set, Optional, Tuple
+from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
 from bs4 import BeautifulSoup
-import requests
 from ..utils import normalize_url, get_unique_links
 from ..config import ScraperConfig
+from .fetcher import SKIPPED_TAGS, fetch_html
+from .relevance import LinkScorer
 
 
 class Crawler:
@@ -50,6 +54,38 @@ class Crawler:
                 links.append(normalized_url)
         return get_unique_links(links)
 
+    def extract_link_context(
+            self,
+            soup: BeautifulSoup,
+            base_url: str
+    ) -> List[Tuple[str, str, str]]:
+        """Extract links with their anchor text and surrounding text."""
+        links = []
+        seen: Set[str] = set()
+        for a in soup.find_all('a', href=True):
+            href = a.get('href', '').strip()
+            if not href or href.startswith(('#', 'mailto:', 'tel:')):
+                continue
+            normalized_url = normalize_url(urljoin(base_url, href))
+            if normalized_url in seen:
+                continue
+            seen.add(normalized_url)
+            parent = a.parent
+            context = parent.get_text(' ', strip=True)[:300] if parent else ''
+            links.append((normalized_url, a.get_text(' ', strip=True), context))
+        return links
+
+    def fetch_page(self, url: str) -> BeautifulSoup:
+        """Fetch and parse a page."""
+        return BeautifulSoup(fetch_html(url, self.config), 'html.parser')
+
+    def fetch_links(self, url: str) -> List[str]:
+        """Fetch a page and return the links it contains, capped per page."""
+        soup = self.fetch_page(url)
+        page_links = self.extract_links(soup, url)
+
+        return page_links[:self.config.max_links_per_page]
+
     def crawl(self, url: str, depth: int = 0) -> List[str]:
         """Crawl website recursively up to specified depth."""
         if (depth >= self.config.max_depth or
@@ -61,17 +97,7 @@ class Crawler:
         links = []
 
         try:
-            response = requests.get(
-                url,
-                headers={'User-Agent': self.config.user_agent},
-                timeout=self.config.timeout
-            )
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            page_links = self.extract_links(soup, url)
-
-            links.extend(page_links[:self.config.max_links_per_page])
+            links.extend(self.fetch_links(url))
 
             if depth < self.config.max_depth:
                 for link in links:
@@ -80,4 +106,74 @@ class Crawler:
         except Exception as e:
             logging.error(f"Error crawling {url}: {e}")
 
-        return get_unique_links(links)
\ No newline at end of file
+        return get_unique_links(links)
+
+    def crawl_best_first(
+            self,
+            url: str,
+            instructions: str,
+            scorer: Optional[LinkScorer] = None
+    ) -> List[str]:
+        """Crawl the most promising links first, guided by the instructions.
+
+        Links are scored by anchor text, URL tokens and surrounding text and
+        kept in a priority queue. Crawling stops when the frontier is empty,
+        `page_budget` fetches have been attempted, or `relevant_page_target`
+        pages scoring at least `relevance_threshold` have been found.
+
+        Returns:
+            Fetched URLs, most relevant first
+        """
+        scorer = scorer or LinkScorer(instructions)
+        url = normalize_url(url)
+        counter = itertools.count()
+        frontier = [(-1.0, 0, next(counter), url)]
+        queued: Set[str] = {url}
+        page_scores = {}
+        attempts = 0
+        relevant = 0
+
+        while frontier:
+            if (self.config.page_budget is not None and
+                    attempts >= self.config.page_budget):
+                break
+            if (self.config.relevant_page_target is not None and
+                    relevant >= self.config.relevant_page_target):
+                break
+
+            _, depth, _, current = heapq.heappop(frontier)
+            if current in self.visited or not self.can_fetch(current):
+                continue
+            self.visited.add(current)
+            attempts += 1
+
+            try:
+                soup = self.fetch_page(current)
+            except Exception as e:
+                logging.error(f"Error crawling {current}: {e}")
+                continue
+
+            page_links = self.extract_link_context(soup, current)
+
+            # Score only the visible content, as ContentExtractor will see it
+            for element in soup(list(SKIPPED_TAGS)):
+                element.decompose()
+            page_score = scorer.score_page(soup.get_text(' ', strip=True))
+            page_scores[current] = page_score
+            if page_score >= self.config.relevance_threshold:
+                relevant += 1
+
+            if depth + 1 >= self.config.max_depth:
+                continue
+
+            scored = [
+                (scorer.score_link(link, anchor, context), link)
+                for link, anchor, context in page_links
+                if link not in queued
+            ]
+            scored.sort(key=lambda item: item[0], reverse=True)
+            for score, link in scored[:self.config.max_links_per_page]:
+                queued.add(link)
+                heapq.heappush(frontier, (-score, depth + 1, next(counter), link))
+
+        return sorted(page_scores, key=page_scores.get, reverse=True)
@@ -0,0 +1,157 @@
+import logging
+import os
+import socket
+import time
+import uuid
+from threading import Event, Lock, Thread
+from typing import List, Optional, Set
+from ..config import ScraperConfig
+from ..rate_limiter import RateLimiter
+from ..utils import normalize_url, extract_domain
+from ..work_queue import WorkQueue, SQLiteWorkQueue, domain_owner
+from .crawler import Crawler
+
+
+class DistributedCrawler:
+    """Crawls cooperatively with other workers through a shared work queue.
+
+    Each domain is preferred by one live worker (rendezvous hashing over the
+    registered workers) and leased to at most one worker at a time by the
+    queue, so per-domain politeness is enforced locally by that worker's
+    rate limiter while different domains are crawled in parallel across
+    processes or machines.
+    """
+
+    def __init__(self, config: ScraperConfig, queue: Optional[WorkQueue] = None):
+        self.config = config
+        self.queue = queue or SQLiteWorkQueue(config.queue_path)
+        self.worker_id = config.worker_id or (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        )
+        self.crawler = Crawler(config)
+        self.rate_limiter = RateLimiter(config.request_delay)
+        self.workers: List[str] = []
+        self.leased: Set[str] = set()
+        self.leased_lock = Lock()
+        self.stopped = Event()
+
+    def _heartbeat(self):
+        """Refresh registration, membership and the leases currently held."""
+        self.queue.register_worker(self.worker_id)
+        self.workers = self.queue.live_workers(self.config.heartbeat_interval * 3)
+
+        with self.leased_lock:
+            held = list(self.leased)
+        if held:
+            renewed = set(self.queue.renew(
+                self.worker_id, held, self.config.lease_timeout
+            ))
+            with self.leased_lock:
+                self.leased -= set(held) - renewed
+
+    def _heartbeat_loop(self):
+        """Send heartbeats on a timer, independent of fetch progress."""
+        while not self.stopped.wait(self.config.heartbeat_interval):
+            try:
+                self._heartbeat()
+            except Exception as e:
+                logging.warning(f"Heartbeat failed for {self.worker_id}: {e}")
+
+    def owns(self, domain: str) -> bool:
+        """Check whether this worker is responsible for a domain."""
+        return domain_owner(domain, self.workers) == self.worker_id
+
+    def seed(self, urls: List[str]) -> int:
+        """Add start URLs to the shared frontier."""
+        return self.queue.push([(normalize_url(url), 0) for url in urls])
+
+    def process(self, url: str, depth: int) -> List[str]:
+        """Fetch one leased URL and push its outgoing links."""
+        if not self.crawler.can_fetch(url):
+            return []
+
+        self.rate_limiter.wait(url)
+        links = self.crawler.fetch_links(url)
+
+        if depth + 1 < self.config.max_depth:
+            self.queue.push([(link, depth + 1) for link in links])
+        return links
+
+    def run(self, max_idle: Optional[float] = None) -> List[str]:
+        """Claim and crawl URLs until the shared frontier stays empty.
+
+        Args:
+            max_idle: Seconds to keep polling with nothing to claim before
+                giving up while other workers still hold leases. Defaults to
+                long enough for a crashed worker to drop out of membership
+                and for its leases to expire, so its URLs are picked up.
+
+        Returns:
+            URLs crawled by this worker
+        """
+        if max_idle is None:
+            max_idle = self.config.lease_timeout + 3 * self.config.heartbeat_interval
+        crawled = []
+        idle_since = None
+        self.stopped.clear()
+        self._heartbeat()
+        heartbeat = Thread(target=self._heartbeat_loop, daemon=True)
+        heartbeat.start()
+
+        try:
+            while True:
+                batch = self.queue.claim(
+                    self.worker_id,
+                    self.owns,
+                    self.config.claim_batch_size,
+                    self.config.lease_timeout
+                )
+
+                if not batch:
+                    if self.queue.pending_count() == 0:
+                        break
+                    idle_since = idle_since or time.time()
+                    if time.time() - idle_since > max_idle:
+                        break
+                    time.sleep(min(self.config.request_delay, 1.0) or 0.1)
+                    self.workers = self.queue.live_workers(
+                        self.config.heartbeat_interval * 3
+                    )
+                    continue
+
+                idle_since = None
+                with self.leased_lock:
+                    self.leased.update(url for url, _ in batch)
+
+                for url, depth in batch:
+                    # Membership may have changed since the claim; hand the
+                    # URL back if its domain now belongs to another worker
+                    self.workers = self.queue.live_workers(
+                        self.config.heartbeat_interval * 3
+                    )
+                    if not self.owns(extract_domain(url)):
+                        self.queue.release(self.worker_id, [url])
+                        with self.leased_lock:
+                            self.leased.discard(url)
+                        continue
+
+                    try:
+                        self.process(url, depth)
+                    except Exception as e:
+                        logging.error(f"Error crawling {url}: {e}")
+
+                    with self.leased_lock:
+                        self.leased.discard(url)
+                    if self.queue.complete(self.worker_id, url):
+                        crawled.append(url)
+                    else:
+                        logging.warning(f"Lease on {url} was lost before completion")
+        finally:
+            self.stopped.set()
+            heartbeat.join()
+            # Hand back anything still leased so other workers can take it
+            self.queue.unregister_worker(self.worker_id)
+            with self.leased_lock:
+                self.leased.clear()
+
+        return crawled
@@ -1,8 +1,8 @@
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-import requests
 from ..config import ScraperConfig
 from ..nlp import TextProcessor
+from .fetcher import SKIPPED_TAGS, fetch_html
 
 
 class ContentExtractor:
@@ -17,7 +17,7 @@ class ContentExtractor:
         soup = BeautifulSoup(html, 'html.parser')
 
         # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'footer']):
+        for element in soup(list(SKIPPED_TAGS)):
             element.decompose()
 
         return soup
@@ -25,7 +25,7 @@ class ContentExtractor:
     def extract_text(self, soup: BeautifulSoup) -> str:
         """Extract clean text from HTML soup."""
         text = soup.get_text(separator=' ', strip=True)
-        return self.clean_text(text)
+        return self.clean_text(text)[:self.config.max_text_length]
 
     def clean_text(self, text: str) -> str:
         """Clean extracted text by removing extra whitespace and normalizing characters."""
@@ -100,15 +100,21 @@ class ContentExtractor:
     def process_page(self, url: str) -> Dict[str, Any]:
         """Process a complete web page and extract all relevant information."""
         try:
-            response = requests.get(url, headers=self.config.headers)
-            response.raise_for_status()
+            html = fetch_html(url, self.config, self.config.max_text_length)
+            soup = self.clean_html(html)
+            text = self.extract_text(soup)
 
-            soup = self.clean_html(response.text)
+            if len(text) < self.config.min_text_length:
+                return {
+                    'url': url,
+                    'status': 'skipped',
+                    'reason': f"Text shorter than {self.config.min_text_length} characters"
+                }
 
             return {
                 'url': url,
                 'metadata': self.extract_metadata(soup),
-                'text': self.extract_text(soup),
+                'text': text,
                 'links': self.extract_links(soup),
                 'images': self.extract_images(soup),
                 'status': 'success'
@@ -0,0 +1,162 @@
+import codecs
+import logging
+import socket
+import time
+from html.parser import HTMLParser
+from threading import Lock, Timer
+from typing import Optional
+import requests
+from ..config import ScraperConfig
+
+SKIPPED_TAGS = {'script', 'style', 'nav', 'footer'}
+
+
+class TextCollector(HTMLParser):
+    """Incremental HTML parser that counts visible text as chunks arrive."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.text_length = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            words = data.split()
+            if words:
+                self.text_length += len(' '.join(words)) + 1
+
+
+class _Watchdog:
+    """Cuts a streamed response's connection once the download deadline passes.
+
+    A read blocked on a slow server only returns once its chunk fills, so the
+    socket is shut down from a timer thread to make it return.
+    """
+
+    def __init__(self, response: requests.Response, timeout: float):
+        self.response = response
+        self.lock = Lock()
+        self.finished = False
+        self.fired = False
+        self.timer = Timer(max(timeout, 0), self._abort)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def _abort(self):
+        with self.lock:
+            if self.finished:
+                return
+            self.fired = True
+        try:
+            # fromfd duplicates the descriptor; shutting down the duplicate
+            # still shuts down the connection both refer to
+            fd = self.response.raw.fileno()
+            with socket.fromfd(fd, socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.shutdown(socket.SHUT_RDWR)
+        except (OSError, ValueError):
+            pass
+        self.response.close()
+
+    def stop(self) -> bool:
+        """Disarm the watchdog. Returns True if it had already cut the connection."""
+        with self.lock:
+            self.finished = True
+        self.timer.cancel()
+        return self.fired
+
+
+def fetch_html(
+        url: str,
+        config: ScraperConfig,
+        max_text_length: Optional[int] = None
+) -> str:
+    """Download an HTML page as a bounded stream.
+
+    The response is rejected before its body is read if the Content-Type is
+    not allowed or the Content-Length exceeds `max_download_bytes`. The body
+    is read in chunks and cut off at `max_download_bytes`, or earlier once
+    `max_text_length` characters of visible text have been seen. `timeout`
+    bounds the whole download, not just each socket read, so a server that
+    trickles bytes cannot hold the fetch open.
+
+    Args:
+        url: Page to fetch
+        config: Scraper configuration
+        max_text_length: Stop reading once this much text has been collected
+
+    Returns:
+        The (possibly truncated) decoded HTML
+
+    Raises:
+        TimeoutError: If the download takes longer than `timeout` in total
+    """
+    deadline = time.monotonic() + config.timeout
+    with requests.get(
+            url,
+            headers={'User-Agent': config.user_agent},
+            timeout=config.timeout,
+            stream=True
+    ) as response:
+        response.raise_for_status()
+
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and content_type not in config.allowed_content_types:
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > config.max_download_bytes:
+            raise ValueError(f"Content too large: {content_length} bytes")
+
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')('replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')('replace')
+
+        collector = TextCollector() if max_text_length else None
+        parts = []
+        received = 0
+
+        watchdog = _Watchdog(response, deadline - time.monotonic())
+        timed_out = f"Download of {url} exceeded {config.timeout}s"
+        try:
+            for chunk in response.iter_content(chunk_size=config.chunk_size):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(timed_out)
+
+                remaining = config.max_download_bytes - received
+                chunk = chunk[:remaining]
+                received += len(chunk)
+
+                text = decoder.decode(chunk)
+                parts.append(text)
+
+                if collector:
+                    collector.feed(text)
+                    if collector.text_length >= max_text_length:
+                        break
+                if received >= config.max_download_bytes:
+                    logging.warning(f"Truncated {url} at {config.max_download_bytes} bytes")
+                    break
+        except TimeoutError:
+            watchdog.stop()
+            raise
+        except Exception as e:
+            if watchdog.stop():
+                raise TimeoutError(timed_out) from e
+            raise
+
+        # The watchdog may end the stream with a clean EOF rather than an error
+        if watchdog.stop():
+            raise TimeoutError(timed_out)
+
+        parts.append(decoder.decode(b'', final=True))
+
+    return ''.join(parts)
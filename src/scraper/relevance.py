@@ -0,0 +1,65 @@
+import re
+from typing import Dict, List, Set
+from urllib.parse import urlparse
+
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'are', 'was', 'were',
+    'all', 'any', 'about', 'into', 'find', 'get', 'give', 'show', 'list',
+    'information', 'info', 'page', 'pages', 'please', 'what', 'which', 'how',
+    'www', 'http', 'https', 'html', 'htm', 'php', 'aspx', 'index'
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase terms with a crude plural strip."""
+    terms = []
+    for token in re.findall(r'[a-z0-9]+', text.lower()):
+        if len(token) <= 2 or token in STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+class LinkScorer:
+    """Cheap lexical relevance scoring of links and pages against instructions.
+
+    Scores are the weighted fraction of instruction terms found in each
+    signal, so they fall in [0, 1] and need no model or network access.
+    """
+
+    def __init__(
+            self,
+            instructions: str,
+            anchor_weight: float = 0.5,
+            url_weight: float = 0.3,
+            context_weight: float = 0.2
+    ):
+        self.terms: Set[str] = set(tokenize(instructions))
+        self.anchor_weight = anchor_weight
+        self.url_weight = url_weight
+        self.context_weight = context_weight
+        self._url_cache: Dict[str, float] = {}
+
+    def _coverage(self, text: str) -> float:
+        """Fraction of instruction terms present in text."""
+        if not self.terms or not text:
+            return 0.0
+        return len(self.terms.intersection(tokenize(text))) / len(self.terms)
+
+    def _url_score(self, url: str) -> float:
+        if url not in self._url_cache:
+            parsed = urlparse(url)
+            self._url_cache[url] = self._coverage(f"{parsed.path} {parsed.query}")
+        return self._url_cache[url]
+
+    def score_link(self, url: str, anchor: str = '', context: str = '') -> float:
+        """Score a link by its anchor text, URL tokens and surrounding text."""
+        return (self.anchor_weight * self._coverage(anchor) +
+                self.url_weight * self._url_score(url) +
+                self.context_weight * self._coverage(context))
+
+    def score_page(self, text: str) -> float:
+        """Score fetched page text."""
+        return self._coverage(text)
@@ -0,0 +1,448 @@
+import hashlib
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+from .utils import extract_domain
+
+
+def domain_owner(domain: str, workers: List[str]) -> Optional[str]:
+    """Pick the worker responsible for a domain using rendezvous hashing.
+
+    Every worker computes the same answer from the same membership list, and
+    a worker joining or leaving only moves the domains it owns or takes over.
+    """
+    if not workers:
+        return None
+    return max(
+        workers,
+        key=lambda worker: hashlib.md5(f"{worker}:{domain}".encode()).hexdigest()
+    )
+
+
+class WorkQueue(ABC):
+    """Shared lease-based crawl frontier and seen-set.
+
+    URLs are pushed once (the seen-set), claimed under a time-limited lease by
+    a single worker and marked done when processed. Leases that are not
+    renewed or completed before they expire become claimable again, so URLs
+    held by a worker that dies are picked up by the others.
+
+    Domains are leased alongside their URLs: a worker can only claim URLs of
+    a domain nobody else holds, which keeps each domain's requests on one
+    worker even while membership is changing.
+    """
+
+    @abstractmethod
+    def register_worker(self, worker_id: str):
+        """Announce a worker or refresh its heartbeat."""
+
+    @abstractmethod
+    def unregister_worker(self, worker_id: str):
+        """Remove a worker and return its leased URLs to the queue."""
+
+    @abstractmethod
+    def live_workers(self, ttl: float) -> List[str]:
+        """Return workers whose heartbeat is newer than `ttl` seconds."""
+
+    @abstractmethod
+    def push(self, urls: List[Tuple[str, int]]) -> int:
+        """Add (url, depth) pairs not seen before. Returns how many were new."""
+
+    @abstractmethod
+    def claim(
+            self,
+            worker_id: str,
+            owns: Callable[[str], bool],
+            limit: int,
+            lease_timeout: float
+    ) -> List[Tuple[str, int]]:
+        """Lease up to `limit` available URLs whose domain passes `owns`."""
+
+    @abstractmethod
+    def renew(self, worker_id: str, urls: List[str], lease_timeout: float) -> List[str]:
+        """Extend leases this worker still holds. Returns the URLs renewed."""
+
+    @abstractmethod
+    def release(self, worker_id: str, urls: List[str]):
+        """Hand leased URLs back to the queue without processing them."""
+
+    @abstractmethod
+    def complete(self, worker_id: str, url: str) -> bool:
+        """Mark a URL leased by this worker as processed.
+
+        Returns False if the worker no longer holds the lease.
+        """
+
+    @abstractmethod
+    def pending_count(self) -> int:
+        """Number of URLs that are queued or currently leased."""
+
+
+class InMemoryWorkQueue(WorkQueue):
+    """Process-local work queue, useful for tests and single-process runs."""
+
+    def __init__(self):
+        self.lock = Lock()
+        self.items: Dict[str, Dict] = {}
+        self.domains: Dict[str, Dict] = {}
+        self.workers: Dict[str, float] = {}
+
+    def _free_domain(self, worker_id: str, domain: str):
+        """Drop a domain lease once the worker holds no URLs in it."""
+        lease = self.domains[domain]
+        if lease['owner'] != worker_id:
+            return
+        if not any(item['domain'] == domain and item['status'] == 'leased' and
+                   item['owner'] == worker_id for item in self.items.values()):
+            lease.update(owner=None, expires=0.0)
+
+    def register_worker(self, worker_id: str):
+        with self.lock:
+            self.workers[worker_id] = time.time()
+
+    def unregister_worker(self, worker_id: str):
+        with self.lock:
+            self.workers.pop(worker_id, None)
+            for item in self.items.values():
+                if item['status'] == 'leased' and item['owner'] == worker_id:
+                    item.update(status='pending', owner=None, expires=0.0)
+            for lease in self.domains.values():
+                if lease['owner'] == worker_id:
+                    lease.update(owner=None, expires=0.0)
+
+    def live_workers(self, ttl: float) -> List[str]:
+        cutoff = time.time() - ttl
+        with self.lock:
+            return sorted(w for w, seen in self.workers.items() if seen >= cutoff)
+
+    def push(self, urls: List[Tuple[str, int]]) -> int:
+        added = 0
+        with self.lock:
+            for url, depth in urls:
+                if url in self.items:
+                    continue
+                domain = extract_domain(url)
+                self.items[url] = {
+                    'domain': domain,
+                    'depth': depth,
+                    'status': 'pending',
+                    'owner': None,
+                    'expires': 0.0
+                }
+                lease = self.domains.setdefault(
+                    domain, {'owner': None, 'expires': 0.0, 'remaining': 0}
+                )
+                lease['remaining'] += 1
+                added += 1
+        return added
+
+    def claim(
+            self,
+            worker_id: str,
+            owns: Callable[[str], bool],
+            limit: int,
+            lease_timeout: float
+    ) -> List[Tuple[str, int]]:
+        now = time.time()
+        claimed = []
+        with self.lock:
+            for domain, lease in self.domains.items():
+                if len(claimed) >= limit:
+                    break
+                if lease['remaining'] == 0 or not owns(domain):
+                    continue
+                if lease['owner'] not in (None, worker_id) and lease['expires'] >= now:
+                    continue
+                lease.update(owner=worker_id, expires=now + lease_timeout)
+
+                for url, item in self.items.items():
+                    if len(claimed) >= limit:
+                        break
+                    available = (item['status'] == 'pending' or
+                                 (item['status'] == 'leased' and item['expires'] < now))
+                    if item['domain'] == domain and available:
+                        item.update(status='leased', owner=worker_id,
+                                    expires=now + lease_timeout)
+                        claimed.append((url, item['depth']))
+                self._free_domain(worker_id, domain)
+        return claimed
+
+    def renew(self, worker_id: str, urls: List[str], lease_timeout: float) -> List[str]:
+        expires = time.time() + lease_timeout
+        renewed = []
+        with self.lock:
+            for url in urls:
+                item = self.items.get(url)
+                if item and item['status'] == 'leased' and item['owner'] == worker_id:
+                    item['expires'] = expires
+                    lease = self.domains[item['domain']]
+                    if lease['owner'] == worker_id:
+                        lease['expires'] = expires
+                    renewed.append(url)
+        return renewed
+
+    def release(self, worker_id: str, urls: List[str]):
+        with self.lock:
+            for url in urls:
+                item = self.items.get(url)
+                if item and item['status'] == 'leased' and item['owner'] == worker_id:
+                    item.update(status='pending', owner=None, expires=0.0)
+                    self._free_domain(worker_id, item['domain'])
+
+    def complete(self, worker_id: str, url: str) -> bool:
+        with self.lock:
+            item = self.items.get(url)
+            if not item or item['status'] != 'leased' or item['owner'] != worker_id:
+                return False
+            item.update(status='done', owner=None)
+            self.domains[item['domain']]['remaining'] -= 1
+            self._free_domain(worker_id, item['domain'])
+            return True
+
+    def pending_count(self) -> int:
+        with self.lock:
+            return sum(lease['remaining'] for lease in self.domains.values())
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue stored in a SQLite file, shareable between processes and
+    between machines that mount the same volume."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS frontier (
+                    url TEXT PRIMARY KEY,
+                    domain TEXT NOT NULL,
+                    depth INTEGER NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    owner TEXT,
+                    expires REAL NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS frontier_domain_status
+                    ON frontier (domain, status, expires);
+                CREATE TABLE IF NOT EXISTS domains (
+                    domain TEXT PRIMARY KEY,
+                    owner TEXT,
+                    expires REAL NOT NULL DEFAULT 0,
+                    remaining INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS domains_remaining
+                    ON domains (remaining);
+                CREATE TABLE IF NOT EXISTS workers (
+                    worker_id TEXT PRIMARY KEY,
+                    last_seen REAL NOT NULL
+                );
+            """)
+        finally:
+            conn.close()
+
+    def _transaction(self, mode: str = 'IMMEDIATE') -> '_Transaction':
+        """Open a connection wrapped in a single transaction.
+
+        Writers take the lock up front (IMMEDIATE); readers use DEFERRED so
+        they never block each other.
+        """
+        conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        return _Transaction(conn, mode)
+
+    @staticmethod
+    def _free_domain(conn: sqlite3.Connection, worker_id: str, domain: str):
+        """Drop a domain lease once the worker holds no URLs in it."""
+        conn.execute(
+            "UPDATE domains SET owner = NULL, expires = 0 "
+            "WHERE domain = ? AND owner = ? AND NOT EXISTS ("
+            "SELECT 1 FROM frontier WHERE domain = ? AND status = 'leased' "
+            "AND owner = ?)",
+            (domain, worker_id, domain, worker_id)
+        )
+
+    @staticmethod
+    def _leased_domain(conn: sqlite3.Connection, worker_id: str, url: str) -> Optional[str]:
+        """Domain of a URL if this worker currently holds its lease."""
+        row = conn.execute(
+            "SELECT domain FROM frontier WHERE url = ? AND owner = ? AND status = 'leased'",
+            (url, worker_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def register_worker(self, worker_id: str):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO workers (worker_id, last_seen) VALUES (?, ?)",
+                (worker_id, time.time())
+            )
+
+    def unregister_worker(self, worker_id: str):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+            conn.execute(
+                "UPDATE frontier SET status = 'pending', owner = NULL, expires = 0 "
+                "WHERE status = 'leased' AND owner = ?",
+                (worker_id,)
+            )
+            conn.execute(
+                "UPDATE domains SET owner = NULL, expires = 0 WHERE owner = ?",
+                (worker_id,)
+            )
+
+    def live_workers(self, ttl: float) -> List[str]:
+        with self._transaction('DEFERRED') as conn:
+            rows = conn.execute(
+                "SELECT worker_id FROM workers WHERE last_seen >= ? ORDER BY worker_id",
+                (time.time() - ttl,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def push(self, urls: List[Tuple[str, int]]) -> int:
+        if not urls:
+            return 0
+        added = 0
+        with self._transaction() as conn:
+            for url, depth in urls:
+                domain = extract_domain(url)
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO frontier (url, domain, depth) VALUES (?, ?, ?)",
+                    (url, domain, depth)
+                )
+                if cursor.rowcount:
+                    conn.execute(
+                        "INSERT INTO domains (domain, remaining) VALUES (?, 1) "
+                        "ON CONFLICT (domain) DO UPDATE SET remaining = remaining + 1",
+                        (domain,)
+                    )
+                    added += 1
+        return added
+
+    def claim(
+            self,
+            worker_id: str,
+            owns: Callable[[str], bool],
+            limit: int,
+            lease_timeout: float
+    ) -> List[Tuple[str, int]]:
+        now = time.time()
+        with self._transaction('DEFERRED') as conn:
+            candidates = [
+                row[0] for row in conn.execute(
+                    "SELECT domain FROM domains WHERE remaining > 0 "
+                    "AND (owner IS NULL OR owner = ? OR expires < ?)",
+                    (worker_id, now)
+                )
+                if owns(row[0])
+            ]
+        if not candidates:
+            return []
+
+        claimed = []
+        expires = now + lease_timeout
+        with self._transaction() as conn:
+            for domain in candidates:
+                wanted = limit - len(claimed)
+                if wanted <= 0:
+                    break
+                cursor = conn.execute(
+                    "UPDATE domains SET owner = ?, expires = ? WHERE domain = ? "
+                    "AND (owner IS NULL OR owner = ? OR expires < ?)",
+                    (worker_id, expires, domain, worker_id, now)
+                )
+                if not cursor.rowcount:
+                    continue
+
+                rows = conn.execute(
+                    "SELECT url, depth FROM frontier "
+                    "WHERE domain = ? AND status = 'pending' LIMIT ?",
+                    (domain, wanted)
+                ).fetchall()
+                if len(rows) < wanted:
+                    rows += conn.execute(
+                        "SELECT url, depth FROM frontier "
+                        "WHERE domain = ? AND status = 'leased' AND expires < ? LIMIT ?",
+                        (domain, now, wanted - len(rows))
+                    ).fetchall()
+                conn.executemany(
+                    "UPDATE frontier SET status = 'leased', owner = ?, expires = ? "
+                    "WHERE url = ?",
+                    [(worker_id, expires, url) for url, _ in rows]
+                )
+                self._free_domain(conn, worker_id, domain)
+                claimed.extend(rows)
+        return [(url, depth) for url, depth in claimed]
+
+    def renew(self, worker_id: str, urls: List[str], lease_timeout: float) -> List[str]:
+        expires = time.time() + lease_timeout
+        renewed = []
+        with self._transaction() as conn:
+            for url in urls:
+                domain = self._leased_domain(conn, worker_id, url)
+                if domain is None:
+                    continue
+                conn.execute(
+                    "UPDATE frontier SET expires = ? WHERE url = ?", (expires, url)
+                )
+                conn.execute(
+                    "UPDATE domains SET expires = ? WHERE domain = ? AND owner = ?",
+                    (expires, domain, worker_id)
+                )
+                renewed.append(url)
+        return renewed
+
+    def release(self, worker_id: str, urls: List[str]):
+        with self._transaction() as conn:
+            for url in urls:
+                domain = self._leased_domain(conn, worker_id, url)
+                if domain is None:
+                    continue
+                conn.execute(
+                    "UPDATE frontier SET status = 'pending', owner = NULL, expires = 0 "
+                    "WHERE url = ?",
+                    (url,)
+                )
+                self._free_domain(conn, worker_id, domain)
+
+    def complete(self, worker_id: str, url: str) -> bool:
+        with self._transaction() as conn:
+            domain = self._leased_domain(conn, worker_id, url)
+            if domain is None:
+                return False
+            conn.execute(
+                "UPDATE frontier SET status = 'done', owner = NULL WHERE url = ?",
+                (url,)
+            )
+            conn.execute(
+                "UPDATE domains SET remaining = remaining - 1 WHERE domain = ?",
+                (domain,)
+            )
+            self._free_domain(conn, worker_id, domain)
+            return True
+
+    def pending_count(self) -> int:
+        with self._transaction('DEFERRED') as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(remaining), 0) FROM domains"
+            ).fetchone()[0]
+
+
+class _Transaction:
+    """Wraps a SQLite connection so `with` runs one transaction and closes
+    the connection afterwards."""
+
+    def __init__(self, conn: sqlite3.Connection, mode: str = 'IMMEDIATE'):
+        self.conn = conn
+        self.mode = mode
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute(f"BEGIN {self.mode}")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.conn.close()
@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import Counter, defaultdict
+
+import pytest
+
+from src.config import ScraperConfig
+from src.scraper.distributed import DistributedCrawler
+from src.utils import extract_domain
+from src.work_queue import InMemoryWorkQueue, SQLiteWorkQueue, WorkQueue, domain_owner
+
+DOMAINS = ['a.example', 'b.example', 'c.example', 'd.example']
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def queue(request, tmp_path):
+    if request.param == 'memory':
+        return InMemoryWorkQueue()
+    return SQLiteWorkQueue(str(tmp_path / 'queue.sqlite'))
+
+
+def make_config(**overrides):
+    settings = dict(
+        max_depth=3,
+        request_delay=0.0,
+        follow_robots_txt=False,
+        heartbeat_interval=0.05,
+        lease_timeout=5.0,
+        claim_batch_size=3
+    )
+    settings.update(overrides)
+    return ScraperConfig(**settings)
+
+
+def site_links(url):
+    """Fake link graph: every page links to four children on its domain and
+    to the root of the next domain."""
+    domain = extract_domain(url)
+    path = url.split(domain, 1)[1].rstrip('/')
+    next_domain = DOMAINS[(DOMAINS.index(domain) + 1) % len(DOMAINS)]
+    children = [f"https://{domain}{path}/{i}" for i in range(4)]
+    return children + [f"https://{next_domain}/"]
+
+
+class FetchRecorder:
+    """Stub for Crawler.fetch_links that records fetches and concurrency."""
+
+    def __init__(self, delay=0.005):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.fetched = Counter()
+        self.in_flight = defaultdict(set)
+        self.overlaps = []
+
+    def __call__(self, worker_id, url):
+        domain = extract_domain(url)
+        with self.lock:
+            if self.in_flight[domain]:
+                self.overlaps.append((domain, worker_id, set(self.in_flight[domain])))
+            self.in_flight[domain].add(worker_id)
+            self.fetched[url] += 1
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight[domain].discard(worker_id)
+        return site_links(url)
+
+
+def make_worker(queue, worker_id, recorder, **overrides):
+    worker = DistributedCrawler(make_config(worker_id=worker_id, **overrides), queue)
+    worker.crawler.fetch_links = lambda url: recorder(worker_id, url)
+    return worker
+
+
+def run_workers(workers):
+    results = {}
+    threads = [
+        threading.Thread(target=lambda w=w: results.update({w.worker_id: w.run(max_idle=2)}))
+        for w in workers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    return results
+
+
+def test_work_queue_is_abstract():
+    class Partial(WorkQueue):
+        def push(self, urls):
+            return 0
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_two_workers_fetch_each_url_once(queue):
+    recorder = FetchRecorder()
+    workers = [make_worker(queue, name, recorder) for name in ('w1', 'w2')]
+    workers[0].seed([f"https://{domain}/" for domain in DOMAINS])
+
+    results = run_workers(workers)
+
+    crawled = results['w1'] + results['w2']
+    assert len(crawled) == len(set(crawled))
+    assert set(crawled) == set(recorder.fetched)
+    assert all(count == 1 for count in recorder.fetched.values())
+    assert queue.pending_count() == 0
+    assert results['w1'] and results['w2']
+
+
+def test_domains_are_never_fetched_concurrently(queue):
+    recorder = FetchRecorder(delay=0.02)
+    workers = [make_worker(queue, f"w{i}", recorder) for i in range(3)]
+    workers[0].seed([f"https://{domain}/" for domain in DOMAINS])
+
+    run_workers(workers)
+
+    assert recorder.overlaps == []
+
+
+def test_expired_lease_is_reclaimed_and_stale_complete_rejected(queue):
+    queue.push([('https://a.example/', 0)])
+
+    assert queue.claim('w1', lambda d: True, 10, 0.05) == [('https://a.example/', 0)]
+    assert queue.claim('w2', lambda d: True, 10, 5.0) == []
+
+    time.sleep(0.1)
+    assert queue.claim('w2', lambda d: True, 10, 5.0) == [('https://a.example/', 0)]
+
+    assert queue.complete('w1', 'https://a.example/') is False
+    assert queue.pending_count() == 1
+    assert queue.complete('w2', 'https://a.example/') is True
+    assert queue.pending_count() == 0
+
+
+def test_renew_keeps_lease_past_original_timeout(queue):
+    queue.push([('https://a.example/', 0)])
+    queue.claim('w1', lambda d: True, 10, 0.1)
+
+    time.sleep(0.05)
+    assert queue.renew('w1', ['https://a.example/'], 5.0) == ['https://a.example/']
+    time.sleep(0.1)
+
+    assert queue.claim('w2', lambda d: True, 10, 5.0) == []
+    assert queue.renew('w2', ['https://a.example/'], 5.0) == []
+
+
+def test_unregister_returns_leased_urls(queue):
+    queue.push([('https://a.example/1', 1), ('https://a.example/2', 1)])
+    queue.register_worker('w1')
+    assert len(queue.claim('w1', lambda d: True, 10, 60.0)) == 2
+
+    queue.unregister_worker('w1')
+
+    assert 'w1' not in queue.live_workers(60.0)
+    assert sorted(queue.claim('w2', lambda d: True, 10, 60.0)) == [
+        ('https://a.example/1', 1), ('https://a.example/2', 1)
+    ]
+
+
+def test_domain_lease_blocks_other_workers_until_released(queue):
+    queue.push([('https://a.example/1', 0), ('https://a.example/2', 0)])
+
+    assert queue.claim('w1', lambda d: True, 1, 60.0) == [('https://a.example/1', 0)]
+    # w2 cannot start on a.example while w1 still holds one of its URLs
+    assert queue.claim('w2', lambda d: True, 10, 60.0) == []
+
+    queue.release('w1', ['https://a.example/1'])
+    assert len(queue.claim('w2', lambda d: True, 10, 60.0)) == 2
+
+
+def test_worker_hands_back_domains_it_no_longer_owns(queue):
+    recorder = FetchRecorder()
+    worker = make_worker(queue, 'w1', recorder, max_depth=1, heartbeat_interval=30.0)
+    worker.seed([f"https://{domain}/" for domain in DOMAINS])
+    # A second worker that never runs still takes its share of domains
+    queue.register_worker('w2')
+    w2_domains = {d for d in DOMAINS if domain_owner(d, ['w1', 'w2']) == 'w2'}
+
+    crawled = worker.run(max_idle=0.2)
+
+    assert {extract_domain(u) for u in crawled} == set(DOMAINS) - w2_domains
+    assert queue.pending_count() == len(w2_domains)
+
+
+def test_surviving_worker_finishes_urls_of_crashed_worker(queue):
+    recorder = FetchRecorder()
+    config = dict(max_depth=1, lease_timeout=0.5)
+    crashed = make_worker(queue, 'w2', recorder, **config)
+    survivor = make_worker(queue, 'w1', recorder, **config)
+    survivor.seed([f"https://{domain}/" for domain in DOMAINS])
+
+    # w2 registers and leases everything, then dies without unregistering
+    crashed._heartbeat()
+    assert len(queue.claim('w2', lambda d: True, 10, 0.5)) == len(DOMAINS)
+
+    crawled = survivor.run()
+
+    assert sorted(crawled) == sorted(f"https://{domain}/" for domain in DOMAINS)
+    assert queue.pending_count() == 0
@@ -0,0 +1,179 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.config import ScraperConfig
+from src.scraper import fetcher
+from src.scraper.fetcher import fetch_html
+
+PARAGRAPH = "<p>" + "lorem ipsum dolor sit amet " * 20 + "</p>\n"
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def send_head(self, content_type='text/html; charset=utf-8', length=None):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        if length is not None:
+            self.send_header('Content-Length', str(length))
+        self.end_headers()
+        self.wfile.flush()
+
+    def stream(self, count, delay=0.0):
+        try:
+            for _ in range(count):
+                self.wfile.write(PARAGRAPH.encode())
+                self.wfile.flush()
+                time.sleep(delay)
+        except OSError:
+            pass
+
+    def do_GET(self):
+        if self.path == '/page':
+            body = ("<html><body>" + PARAGRAPH * 3 + "</body></html>").encode()
+            self.send_head(length=len(body))
+            self.wfile.write(body)
+        elif self.path == '/binary':
+            # Headers arrive at once, the body would take a long time
+            self.send_head('application/pdf')
+            time.sleep(3)
+            self.stream(1)
+        elif self.path == '/huge':
+            self.send_head(length=10 ** 9)
+            time.sleep(3)
+            self.stream(1)
+        elif self.path == '/endless':
+            self.send_head()
+            self.stream(10000)
+        elif self.path == '/scripted':
+            self.send_head()
+            self.wfile.write(b"<html><script>" + b"x" * 5000 + b"</script><body>")
+            self.stream(2000)
+        elif self.path == '/trickle':
+            self.send_head()
+            try:
+                while True:
+                    self.wfile.write(b"<")
+                    self.wfile.flush()
+                    time.sleep(0.05)
+            except OSError:
+                pass
+        elif self.path == '/short':
+            self.send_head()
+            self.wfile.write(b"<html><body><p>Hi.</p></body></html>")
+
+
+@pytest.fixture(scope='module')
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def make_config(**overrides):
+    settings = dict(timeout=5, chunk_size=1024, max_download_bytes=50000)
+    settings.update(overrides)
+    return ScraperConfig(**settings)
+
+
+def test_fetches_small_page(server):
+    html = fetch_html(f"{server}/page", make_config())
+
+    assert html.startswith("<html>") and html.endswith("</html>")
+
+
+def test_rejects_content_type_before_body(server):
+    start = time.monotonic()
+    with pytest.raises(ValueError, match="content type"):
+        fetch_html(f"{server}/binary", make_config())
+    assert time.monotonic() - start < 2
+
+
+def test_rejects_declared_length_before_body(server):
+    start = time.monotonic()
+    with pytest.raises(ValueError, match="too large"):
+        fetch_html(f"{server}/huge", make_config())
+    assert time.monotonic() - start < 2
+
+
+def test_truncates_at_byte_budget(server):
+    html = fetch_html(f"{server}/endless", make_config(max_download_bytes=10000))
+
+    assert len(html.encode()) == 10000
+
+
+def test_stops_once_enough_text_collected(server):
+    html = fetch_html(f"{server}/scripted", make_config(), max_text_length=2000)
+
+    # Script text does not count towards the text budget
+    assert 5000 + 2000 < len(html) < 5000 + 2000 + 2 * 1024 + len(PARAGRAPH)
+
+
+def test_total_timeout_on_trickling_server(server):
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        fetch_html(f"{server}/trickle", make_config(timeout=1))
+    assert time.monotonic() - start < 3
+
+
+class FakeRaw:
+    def fileno(self):
+        raise OSError("no file to get a fileno from")
+
+
+class FakeResponse:
+    raw = FakeRaw()
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_watchdog_stopped_before_deadline_never_fires():
+    response = FakeResponse()
+    watchdog = fetcher._Watchdog(response, 0.05)
+
+    assert watchdog.stop() is False
+    time.sleep(0.1)
+    assert watchdog.fired is False and response.closed is False
+
+
+def test_watchdog_cannot_fire_after_read_finished():
+    response = FakeResponse()
+    watchdog = fetcher._Watchdog(response, 0.05)
+    # The read finished under the lock before the timer got to run
+    with watchdog.lock:
+        watchdog.finished = True
+        time.sleep(0.1)
+
+    assert watchdog.stop() is False
+    assert response.closed is False
+
+
+def test_watchdog_reports_firing():
+    response = FakeResponse()
+    watchdog = fetcher._Watchdog(response, 0.01)
+    time.sleep(0.1)
+
+    assert watchdog.stop() is True
+    assert response.closed is True
+
+
+def test_short_page_is_skipped(server, monkeypatch):
+    pytest.importorskip('spacy')
+    pytest.importorskip('transformers')
+    from src.scraper import extractor
+
+    monkeypatch.setattr(extractor, 'TextProcessor', lambda language: None)
+    result = extractor.ContentExtractor(make_config()).process_page(f"{server}/short")
+
+    assert result['status'] == 'skipped'
+    assert 'error' not in result
+    assert 'reason' in result
@@ -0,0 +1,108 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from src.config import ScraperConfig
+from src.scraper.crawler import Crawler
+from src.scraper.relevance import LinkScorer, tokenize
+
+INSTRUCTIONS = "Find pricing plans and product features"
+
+PAGES = {
+    'https://site.test/': """
+        <html><head><script>var pricing = "plans product features";</script></head>
+        <body>
+          <nav><a href="/about">About us</a> <a href="/careers">Careers</a></nav>
+          <p>Welcome to our company.</p>
+          <p>See our <a href="/pricing">pricing</a> today.</p>
+          <a href="/blog">Blog</a>
+        </body></html>
+    """,
+    'https://site.test/pricing': """
+        <html><body>
+          <p>Pricing plans for every team, with product features listed below.</p>
+          <a href="/pricing/enterprise">Enterprise plan features</a>
+          <a href="/">Home</a>
+        </body></html>
+    """,
+    'https://site.test/pricing/enterprise': """
+        <html><body><p>Enterprise pricing plans include all product features.</p></body></html>
+    """,
+    'https://site.test/about': "<html><body><p>Our team.</p><a href='/'>Home</a></body></html>",
+    'https://site.test/careers': "<html><body><p>Jobs.</p></body></html>",
+    'https://site.test/blog': "<html><body><p>News.</p></body></html>",
+}
+
+
+def make_crawler(fail=(), **overrides):
+    settings = dict(max_depth=3, follow_robots_txt=False)
+    settings.update(overrides)
+    crawler = Crawler(ScraperConfig(**settings))
+    crawler.fetched = []
+
+    def fetch_page(url):
+        crawler.fetched.append(url)
+        if url in fail or url not in PAGES:
+            raise ValueError(f"Unsupported content type for {url}")
+        return BeautifulSoup(PAGES[url], 'html.parser')
+
+    crawler.fetch_page = fetch_page
+    return crawler
+
+
+def test_tokenize_drops_stopwords_and_plurals():
+    assert tokenize("Find the pricing plans and features") == ['pricing', 'plan', 'feature']
+
+
+def test_link_scorer_prefers_matching_anchor_and_url():
+    scorer = LinkScorer(INSTRUCTIONS)
+
+    pricing = scorer.score_link('https://site.test/pricing', 'pricing plans')
+    about = scorer.score_link('https://site.test/about', 'About us')
+
+    assert pricing > about == 0.0
+    assert 0.0 <= scorer.score_page("pricing plans product features") <= 1.0
+
+
+def test_best_first_follows_relevant_links_first():
+    crawler = make_crawler()
+
+    pages = crawler.crawl_best_first('https://site.test/#top', INSTRUCTIONS)
+
+    assert crawler.fetched[:3] == [
+        'https://site.test/',
+        'https://site.test/pricing',
+        'https://site.test/pricing/enterprise',
+    ]
+    # Links back to the start page are deduplicated against the normalized URL
+    assert crawler.fetched.count('https://site.test/') == 1
+    assert set(pages[:2]) == {
+        'https://site.test/pricing', 'https://site.test/pricing/enterprise'
+    }
+
+
+def test_page_budget_counts_failed_fetches():
+    crawler = make_crawler(fail={'https://site.test/pricing'}, page_budget=2)
+
+    pages = crawler.crawl_best_first('https://site.test/', INSTRUCTIONS)
+
+    assert crawler.fetched == ['https://site.test/', 'https://site.test/pricing']
+    assert pages == ['https://site.test/']
+
+
+def test_relevant_page_target_stops_early():
+    crawler = make_crawler(relevant_page_target=1, relevance_threshold=0.5)
+
+    crawler.crawl_best_first('https://site.test/', INSTRUCTIONS)
+
+    # Script and nav text on the start page must not count as relevant
+    assert crawler.fetched == ['https://site.test/', 'https://site.test/pricing']
+
+
+@pytest.mark.parametrize('max_depth, expected', [(1, 1), (2, 5)])
+def test_max_depth_limits_crawl(max_depth, expected):
+    crawler = make_crawler(max_depth=max_depth)
+
+    crawler.crawl_best_first('https://site.test/', INSTRUCTIONS)
+
+    assert len(crawler.fetched) == expected
+    assert 'https://site.test/pricing/enterprise' not in crawler.fetched